@@ -1,48 +1,88 @@
 # api/api.py
 
-from flask import Flask, request, jsonify
+import time
+_boot_started = time.perf_counter()
+
+from flask import Flask, Response, request, jsonify
 from werkzeug.middleware.proxy_fix import ProxyFix
 import os
 import sys
 import pickle
-import networkx as nx
 import logging
+import threading
 
 # Asegurarse de que Python reconozca la carpeta raíz del proyecto
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# (al principio, para que 'api' resuelva al paquete y no a este módulo)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import (DATA_MART_PATH, JOB_DIR, JOB_WORKERS, JOB_CPU_LIMIT, JOB_TIME_LIMIT,
+                    API_LAZY_STARTUP, API_LOG_FILE, API_BOOT_BUDGET_MS,
+                    VISUALIZE_MAX_NODES, VISUALIZE_MAX_RADIUS)
+from api.lazy import lazy_import
+from graph.exceptions import MissingIndexException
+from api.jobs import JobManager, clusters_task, graph_file_version, maximum_distance_task
+from api.responses import ResponseCache, json_response
+from api.visualization import MIMETYPES, NeighbourhoodRenderer
 
-from config import DATA_MART_PATH
-from graph.graph import Graph
+# networkx (y el paquete graph, que lo importa) solo se cargan junto al grafo
+nx = lazy_import("networkx")
 
 app = Flask(__name__)
 
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1)
 
-# Configurar logging
+# Configurar logging (API_LOG_FILE vacío = solo consola)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s %(levelname)s %(name)s %(message)s',
-    handlers=[
-        logging.FileHandler("app.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.StreamHandler()] + ([logging.FileHandler(API_LOG_FILE)] if API_LOG_FILE else [])
 )
 logger = logging.getLogger(__name__)
 
-# Cargar el grafo serializado
-graph = Graph()
+# Grafo serializado (se carga al importar o, con API_LAZY_STARTUP, en la primera petición)
+graph = None
 is_initialized = False
+graph_version = None
+_graph_lock = threading.Lock()
+_edit_index_lock = threading.Lock()
+
+MAX_WORDS_LIMIT = 1000
+# Estados del DAWG que puede visitar un patrón de /words antes de rechazarlo
+MAX_WORDS_VISITS = 50000
+
+# Índice de borrados de /neighbors, en su propio fichero junto a graph.pkl
+EDIT_INDEX_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'edit_index.pkl')
+
+# Trabajos asíncronos de los endpoints pesados (?mode=async), compartidos por
+# todos los workers de gunicorn a través de JOB_DIR
+job_manager = JobManager(job_dir=JOB_DIR, max_workers=JOB_WORKERS,
+                         cpu_limit=JOB_CPU_LIMIT, time_limit=JOB_TIME_LIMIT)
+
+# Respuestas que solo dependen del grafo, serializadas una vez por versión
+response_cache = ResponseCache()
+
+# Imágenes y layouts de /visualize, cacheados por versión del grafo
+renderer = NeighbourhoodRenderer(max_nodes=VISUALIZE_MAX_NODES)
 
 def load_graph():
-    global is_initialized
+    global graph, is_initialized, graph_version
     try:
+        from graph.graph import Graph
+
         # Ajustar la ruta para apuntar a graphword-mj en lugar de app/api
         serialized_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'graph.pkl')
         if not os.path.isfile(serialized_path):
             logger.error(f"Archivo serializado del grafo no encontrado en {serialized_path}")
             return False
+        version = graph_file_version(serialized_path)
+        loaded = Graph()
         with open(serialized_path, 'rb') as f:
-            graph.graph = pickle.load(f)
+            loaded.graph = pickle.load(f)
+        graph = loaded
+        graph_version = version
+        job_manager.set_graph(serialized_path, graph_version)
+        response_cache.set_version(graph_version)
+        renderer.set_version(graph_version)
         is_initialized = True
         logger.info(f"Grafo cargado exitosamente desde {serialized_path}: {graph.graph.number_of_nodes()} nodos, {graph.graph.number_of_edges()} aristas.")
         return True
@@ -50,12 +90,59 @@ def load_graph():
         logger.error(f"Error al cargar el grafo serializado: {e}", exc_info=True)
         return False
 
-# Cargar el grafo al iniciar la aplicación
-if load_graph():
+def ensure_edit_index():
+    """Carga el índice de borrados (edit_index.pkl) con el primer /neighbors."""
+    if graph.edit_index is not None:
+        return
+    with _edit_index_lock:
+        if graph.edit_index is None:
+            if not os.path.isfile(EDIT_INDEX_PATH):
+                raise MissingIndexException(f"No existe {EDIT_INDEX_PATH}; ejecute initialize_graph.")
+            graph.load_edit_index(EDIT_INDEX_PATH)
+            logger.info(f"Índice de borrados cargado desde {EDIT_INDEX_PATH}")
+
+def ensure_graph():
+    """Carga el grafo una sola vez aunque lleguen varias peticiones a la vez."""
+    if is_initialized:
+        return True
+    with _graph_lock:
+        if is_initialized:
+            return True
+        return load_graph()
+
+@app.before_request
+def load_graph_on_demand():
+    # En arranque diferido el grafo se carga con la primera petición que lo necesita
+    if not is_initialized and request.endpoint not in ("index", "list_routes"):
+        ensure_graph()
+
+if API_LAZY_STARTUP:
+    logger.info("Arranque diferido: el grafo se cargará con la primera petición.")
+elif load_graph():
+    # Con 'gunicorn --preload' esta carga ocurre en el maestro y los workers
+    # comparten el grafo en memoria (copy-on-write) tras el fork
     logger.info("La aplicación ha iniciado con el grafo ya cargado.")
 else:
     logger.error("La aplicación ha iniciado sin un grafo cargado.")
 
+boot_ms = (time.perf_counter() - _boot_started) * 1000
+if boot_ms > API_BOOT_BUDGET_MS:
+    logger.warning(f"Arranque en {boot_ms:.0f} ms, por encima del presupuesto de {API_BOOT_BUDGET_MS} ms.")
+else:
+    logger.info(f"Arranque en {boot_ms:.0f} ms.")
+
+def wants_async():
+    return request.args.get("mode") == "async"
+
+def submit_job(task, **params):
+    try:
+        job = job_manager.submit(task, **params)
+    except Exception as e:
+        logger.error(f"Error al encolar el trabajo {task}: {e}", exc_info=True)
+        return jsonify({"error": f"Error al encolar el trabajo: {str(e)}"}), 500
+    job["status_url"] = f"/jobs/{job['job_id']}"
+    return jsonify(job), 202
+
 @app.route("/", methods=["GET"])
 def index():
     return jsonify({
@@ -63,7 +150,13 @@ def index():
         "endpoints": {
             "GET /shortest-path?word1=...&word2=...": "Obtiene el camino más corto entre dos palabras",
             "GET /clusters": "Retorna los componentes conectados del grafo",
-            "GET /high-connectivity?degree=2": "Retorna los nodos con grado >= 2"
+            "GET /high-connectivity?degree=2": "Retorna los nodos con grado >= 2",
+            "GET /maximum-distance?mode=async": "Encola el cálculo y retorna un job_id (también /clusters y /all-paths)",
+            "GET /jobs/<job_id>": "Retorna el estado y, si terminó, el resultado de un trabajo",
+            "GET /neighbors?word=...&distance=1": "Palabras a distancia de edición <= distance",
+            "GET /words?pattern=c_t&limit=100": "Palabras que encajan con el patrón ('_' una letra, '*' cualquier tramo)",
+            "GET /distance?word1=...&word2=...&mode=exact|estimate": "Número de pasos entre dos palabras o sus cotas",
+            "GET /visualize?word=...&radius=1&format=png|svg": "Imagen del vecindario de una palabra"
         }
     })
 @app.route("/all-paths", methods=["GET"])
@@ -76,10 +169,12 @@ def get_all_paths():
     
     if not w1 or not w2:
         return jsonify({"error": "Faltan parámetros: word1 y word2."}), 400
+    if wants_async():
+        return submit_job("all-paths", word1=w1, word2=w2, max_depth=max_depth)
     
     try:
         paths = graph.all_paths(w1, w2, max_depth)
-        return jsonify({
+        return json_response({
             "paths": [[node.word for node in path] for path in paths],
             "count": len(paths)
         })
@@ -91,9 +186,10 @@ def get_all_paths():
 def get_maximum_distance():
     if not is_initialized:
         return jsonify({"error": "Grafo no inicializado correctamente."}), 500
+    if wants_async():
+        return submit_job("maximum-distance")
     try:
-        max_dist = graph.maximum_distance()
-        return jsonify({"maximum_distance": max_dist})
+        return response_cache.respond(("maximum-distance",), lambda: maximum_distance_task(graph))
     except Exception as e:
         logger.error(f"Error al calcular la distancia máxima: {e}", exc_info=True)
         return jsonify({"error": f"Error al calcular la distancia máxima: {str(e)}"}), 500
@@ -107,8 +203,10 @@ def get_nodes_by_degree():
         return jsonify({"error": "Falta el parámetro: degree."}), 400
     
     try:
-        nodes = graph.nodes_by_degree(degree)
-        return jsonify({"nodes": [n.word for n in nodes]})
+        return response_cache.respond(
+            ("nodes-by-degree", degree),
+            lambda: {"nodes": [n.word for n in graph.nodes_by_degree(degree)]}
+        )
     except Exception as e:
         logger.error(f"Error al obtener nodos por grado: {e}", exc_info=True)
         return jsonify({"error": f"Error al obtener nodos por grado: {str(e)}"}), 500
@@ -118,8 +216,10 @@ def get_isolated_nodes():
     if not is_initialized:
         return jsonify({"error": "Grafo no inicializado correctamente."}), 500
     try:
-        nodes = graph.isolated_nodes()
-        return jsonify({"nodes": [n.word for n in nodes]})
+        return response_cache.respond(
+            ("isolated-nodes",),
+            lambda: {"nodes": [n.word for n in graph.isolated_nodes()]}
+        )
     except Exception as e:
         logger.error(f"Error al obtener nodos aislados: {e}", exc_info=True)
         return jsonify({"error": f"Error al obtener nodos aislados: {str(e)}"}), 500
@@ -134,21 +234,130 @@ def get_shortest_path():
 
     try:
         path = graph.shortest_path(w1, w2)
-        return jsonify({"path": [node.word for node in path]})
+        return json_response({"path": [node.word for node in path]})
     except nx.NetworkXNoPath:
         return jsonify({"message": "No se encontró un camino entre las palabras dadas."}), 404
     except Exception as e:
         logger.error(f"Error al encontrar el camino más corto: {e}", exc_info=True)
         return jsonify({"error": f"Error al encontrar el camino más corto: {str(e)}"}), 500
 
+@app.route("/neighbors", methods=["GET"])
+def get_neighbors():
+    if not is_initialized:
+        return jsonify({"error": "Grafo no inicializado correctamente."}), 500
+    word = request.args.get("word")
+    distance = request.args.get("distance", 1, type=int)
+    if not word:
+        return jsonify({"error": "Falta el parámetro: word."}), 400
+    if distance < 1:
+        return jsonify({"error": "El parámetro distance debe ser >= 1."}), 400
+
+    try:
+        ensure_edit_index()
+        neighbors = graph.edit_neighbors(word, distance)
+        return json_response({
+            "word": word,
+            "distance": distance,
+            "neighbors": [{"word": w, "distance": d} for w, d in neighbors]
+        })
+    except MissingIndexException as e:
+        logger.error(f"Índice de borrados no disponible: {e}")
+        return jsonify({"error": str(e)}), 503
+    except ValueError as e:
+        # La distancia pedida supera la profundidad del índice
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error al obtener vecinos: {e}", exc_info=True)
+        return jsonify({"error": f"Error al obtener vecinos: {str(e)}"}), 500
+
+@app.route("/words", methods=["GET"])
+def get_words():
+    if not is_initialized:
+        return jsonify({"error": "Grafo no inicializado correctamente."}), 500
+    pattern = request.args.get("pattern")
+    limit = request.args.get("limit", 100, type=int)
+    if not pattern:
+        return jsonify({"error": "Falta el parámetro: pattern."}), 400
+    if limit < 1 or limit > MAX_WORDS_LIMIT:
+        return jsonify({"error": f"El parámetro limit debe estar entre 1 y {MAX_WORDS_LIMIT}."}), 400
+
+    try:
+        # Se pide una palabra de más para saber si el resultado se ha truncado
+        words = graph.match_words(pattern.lower(), limit + 1, MAX_WORDS_VISITS)
+        return json_response({
+            "pattern": pattern,
+            "words": words[:limit],
+            "count": min(len(words), limit),
+            "truncated": len(words) > limit
+        })
+    except MissingIndexException as e:
+        logger.error(f"Índice de palabras no disponible: {e}")
+        return jsonify({"error": str(e)}), 503
+    except ValueError as e:
+        # Patrón demasiado costoso (supera MAX_WORDS_VISITS)
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error al buscar palabras: {e}", exc_info=True)
+        return jsonify({"error": f"Error al buscar palabras: {str(e)}"}), 500
+
+@app.route("/distance", methods=["GET"])
+def get_distance():
+    if not is_initialized:
+        return jsonify({"error": "Grafo no inicializado correctamente."}), 500
+    w1 = request.args.get("word1")
+    w2 = request.args.get("word2")
+    mode = request.args.get("mode", "exact")
+    if not w1 or not w2:
+        return jsonify({"error": "Faltan parámetros: word1 y word2."}), 400
+    if mode not in ("exact", "estimate"):
+        return jsonify({"error": "El parámetro mode debe ser 'exact' o 'estimate'."}), 400
+
+    try:
+        if mode == "estimate":
+            lower, upper = graph.distance_bounds(w1, w2)
+            return json_response({"lower_bound": lower, "upper_bound": upper, "exact": lower == upper})
+        return json_response({"distance": graph.distance(w1, w2)})
+    except nx.NetworkXNoPath:
+        return jsonify({"message": "No se encontró un camino entre las palabras dadas."}), 404
+    except nx.NodeNotFound as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception as e:
+        logger.error(f"Error al calcular la distancia: {e}", exc_info=True)
+        return jsonify({"error": f"Error al calcular la distancia: {str(e)}"}), 500
+
+@app.route("/visualize", methods=["GET"])
+def get_visualization():
+    if not is_initialized:
+        return jsonify({"error": "Grafo no inicializado correctamente."}), 500
+    word = request.args.get("word")
+    radius = request.args.get("radius", 1, type=int)
+    fmt = request.args.get("format", "png")
+    if not word:
+        return jsonify({"error": "Falta el parámetro: word."}), 400
+    if radius < 1 or radius > VISUALIZE_MAX_RADIUS:
+        return jsonify({"error": f"El parámetro radius debe estar entre 1 y {VISUALIZE_MAX_RADIUS}."}), 400
+    if fmt not in MIMETYPES:
+        return jsonify({"error": "El parámetro format debe ser 'png' o 'svg'."}), 400
+
+    try:
+        image, node_count = renderer.render(graph, word, radius, fmt)
+        response = Response(image, mimetype=MIMETYPES[fmt])
+        response.headers["X-Graph-Nodes"] = str(node_count)
+        return response
+    except nx.NodeNotFound as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception as e:
+        logger.error(f"Error al visualizar el vecindario: {e}", exc_info=True)
+        return jsonify({"error": f"Error al visualizar el vecindario: {str(e)}"}), 500
+
 @app.route("/clusters", methods=["GET"])
 def get_clusters():
     if not is_initialized:
         return jsonify({"error": "Grafo no inicializado correctamente."}), 500
+    if wants_async():
+        return submit_job("clusters")
     try:
-        clusters = graph.clusters()
-        cluster_list = [list(cluster) for cluster in clusters]
-        return jsonify({"clusters": cluster_list})
+        return response_cache.respond(("clusters",), lambda: clusters_task(graph))
     except Exception as e:
         logger.error(f"Error al obtener clusters: {e}", exc_info=True)
         return jsonify({"error": f"Error al obtener clusters: {str(e)}"}), 500
@@ -159,12 +368,21 @@ def get_high_connectivity():
         return jsonify({"error": "Grafo no inicializado correctamente."}), 500
     degree = request.args.get("degree", 2, type=int)
     try:
-        nodes = graph.high_connectivity_nodes(degree)
-        return jsonify({"nodes": [n.word for n in nodes]})
+        return response_cache.respond(
+            ("high-connectivity", degree),
+            lambda: {"nodes": [n.word for n in graph.high_connectivity_nodes(degree)]}
+        )
     except Exception as e:
         logger.error(f"Error al obtener nodos de alta conectividad: {e}", exc_info=True)
         return jsonify({"error": f"Error al obtener nodos de alta conectividad: {str(e)}"}), 500
 
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Trabajo no encontrado: {job_id}"}), 404
+    return json_response(job)
+
 @app.route("/routes", methods=["GET"])
 def list_routes():
     import urllib
@@ -0,0 +1,106 @@
+import os
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_api(**env):
+    """Importa api.api en un proceso limpio y retorna los módulos pesados ya ejecutados."""
+    code = (
+        "import sys, api.api as a; "
+        "print(a.is_initialized, 'networkx.classes' in sys.modules, 'matplotlib' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=APP_DIR, capture_output=True, text=True,
+        env={**os.environ, "API_LOG_FILE": "", **env}, check=True
+    )
+    return result.stdout.split()
+
+class TestLeanStartup:
+    def test_lazy_startup_defers_graph_and_networkx(self):
+        initialized, networkx_loaded, matplotlib_loaded = import_api(API_LAZY_STARTUP="1")
+        assert initialized == "False"
+        assert networkx_loaded == "False"
+        assert matplotlib_loaded == "False"
+
+class TestJobRoutes:
+    def test_async_mode_returns_job(self, api_client):
+        response = api_client.get("/maximum-distance?mode=async")
+        assert response.status_code == 202
+        job = response.get_json()
+        assert job["status"] in ("pending", "running", "done")
+        assert job["status_url"] == f"/jobs/{job['job_id']}"
+
+        deadline = time.time() + 30
+        while job["status"] not in ("done", "failed") and time.time() < deadline:
+            time.sleep(0.05)
+            job = api_client.get(f"/jobs/{job['job_id']}").get_json()
+        assert job["status"] == "done"
+        assert job["result"] == {"maximum_distance": 4}
+
+    def test_unknown_job_is_404(self, api_client):
+        response = api_client.get("/jobs/no-existe")
+        assert response.status_code == 404
+        assert "error" in response.get_json()
+
+class TestNeighborsRoute:
+    def test_index_loaded_on_first_request(self, api_client, ladder_graph, tmp_path, monkeypatch):
+        from api import api
+        path = str(tmp_path / "edit_index.pkl")
+        ladder_graph.save_edit_index(path)
+        ladder_graph.edit_index = None
+        monkeypatch.setattr(api, "EDIT_INDEX_PATH", path)
+
+        response = api_client.get("/neighbors?word=cord")
+        assert response.status_code == 200
+        assert [n["word"] for n in response.get_json()["neighbors"]] == ["card", "cold", "word"]
+        assert ladder_graph.edit_index is not None
+
+    def test_missing_index_is_server_error(self, api_client, ladder_graph, tmp_path, monkeypatch):
+        from api import api
+        ladder_graph.edit_index = None
+        monkeypatch.setattr(api, "EDIT_INDEX_PATH", str(tmp_path / "no-existe.pkl"))
+        assert api_client.get("/neighbors?word=cord").status_code == 503
+
+    def test_invalid_distance_is_bad_request(self, api_client):
+        assert api_client.get("/neighbors?word=cord&distance=0").status_code == 400
+        # El índice de ladder_graph tiene profundidad 1
+        response = api_client.get("/neighbors?word=cord&distance=2")
+        assert response.status_code == 400
+        assert "distancia máxima" in response.get_json()["error"]
+
+class TestWordsRoute:
+    def test_pattern_match(self, api_client, ladder_graph):
+        ladder_graph.build_word_index()
+        response = api_client.get("/words?pattern=w*")
+        assert response.status_code == 200
+        assert response.get_json()["words"] == ["ward", "warm", "word", "worm"]
+
+    def test_missing_index_is_server_error(self, api_client):
+        # Grafos serializados antes de existir el DAWG no lo traen
+        assert api_client.get("/words?pattern=c_t").status_code == 503
+
+    def test_expensive_pattern_is_bad_request(self, api_client, ladder_graph, monkeypatch):
+        from api import api
+        ladder_graph.build_word_index()
+        monkeypatch.setattr(api, "MAX_WORDS_VISITS", 2)
+        response = api_client.get("/words?pattern=*zqx")
+        assert response.status_code == 400
+        assert "demasiado costoso" in response.get_json()["error"]
+
+class TestVisualizeRoute:
+    def test_renders_neighbourhood(self, api_client):
+        response = api_client.get("/visualize?word=card&radius=1&format=svg")
+        assert response.status_code == 200
+        assert response.mimetype == "image/svg+xml"
+        assert response.headers["X-Graph-Nodes"] == "3"
+
+    def test_invalid_radius_or_format_is_bad_request(self, api_client):
+        from api import api
+        assert api_client.get("/visualize?word=card&radius=0").status_code == 400
+        assert api_client.get(f"/visualize?word=card&radius={api.VISUALIZE_MAX_RADIUS + 1}").status_code == 400
+        assert api_client.get("/visualize?word=card&format=gif").status_code == 400
+
+    def test_unknown_word_is_404(self, api_client):
+        assert api_client.get("/visualize?word=zzzz").status_code == 404
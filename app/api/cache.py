@@ -0,0 +1,48 @@
+# api/cache.py
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class VersionedLRU:
+    """
+    Caché LRU acotada ligada a la versión del grafo: al cambiar la versión se
+    vacía, y los valores calculados con una versión anterior no se guardan.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._version = None
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    def set_version(self, version: str):
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._entries.clear()
+
+    def get(self, key: Hashable):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value, version: Optional[str]) -> bool:
+        """
+        Guarda 'value' si se calculó con la versión vigente ('version' es la
+        leída antes de calcularlo). Retorna si se guardó.
+        """
+        with self._lock:
+            if version != self._version:
+                return False
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
@@ -0,0 +1,22 @@
+from api.cache import VersionedLRU
+
+class TestVersionedLRU:
+    def test_evicts_least_recently_used(self):
+        cache = VersionedLRU(max_entries=2)
+        cache.set_version("v1")
+        cache.put("a", 1, "v1")
+        cache.put("b", 2, "v1")
+        assert cache.get("a") == 1
+        cache.put("c", 3, "v1")
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+    def test_version_change_clears_and_rejects_stale_values(self):
+        cache = VersionedLRU(max_entries=2)
+        cache.set_version("v1")
+        cache.put("a", 1, "v1")
+        cache.set_version("v2")
+        assert cache.get("a") is None
+        # Calculado con la versión anterior: no se guarda
+        assert not cache.put("a", 1, "v1")
+        assert cache.get("a") is None
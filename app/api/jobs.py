@@ -0,0 +1,411 @@
+# api/jobs.py
+
+import fcntl
+import hashlib
+import json
+import logging
+import math
+import multiprocessing
+import os
+import pickle
+import resource
+import shutil
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobLimitExceeded(Exception):
+    """El trabajo superó su límite de CPU o de tiempo."""
+    pass
+
+
+# Tareas pesadas que pueden ejecutarse como trabajo. Cada una recibe el Graph
+# cargado y devuelve el mismo cuerpo JSON que el endpoint síncrono.
+def maximum_distance_task(graph) -> dict:
+    return {"maximum_distance": graph.maximum_distance()}
+
+
+def clusters_task(graph) -> dict:
+    return {"clusters": [[node.word for node in cluster] for cluster in graph.clusters()]}
+
+
+def all_paths_task(graph, word1: str, word2: str, max_depth: int = 15) -> dict:
+    paths = graph.all_paths(word1, word2, max_depth)
+    return {
+        "paths": [[node.word for node in path] for path in paths],
+        "count": len(paths)
+    }
+
+
+TASKS = {
+    "maximum-distance": maximum_distance_task,
+    "clusters": clusters_task,
+    "all-paths": all_paths_task,
+}
+
+
+def graph_file_version(path: str) -> str:
+    """Versión del grafo serializado: cambia cada vez que se regenera graph.pkl."""
+    stat = os.stat(path)
+    return f"{int(stat.st_mtime)}-{stat.st_size}"
+
+
+# --- Lado del proceso worker ---
+
+_worker_graph = None
+_worker_version = None
+
+
+def _init_worker():
+    signal.signal(signal.SIGXCPU, _on_limit)
+    signal.signal(signal.SIGALRM, _on_limit)
+
+
+def _on_limit(signum, frame):
+    limit = "CPU" if signum == signal.SIGXCPU else "tiempo"
+    raise JobLimitExceeded(f"El trabajo superó el límite de {limit}.")
+
+
+def _load_worker_graph(graph_path: str, version: str):
+    """Carga (o recarga, si cambió la versión) el grafo en el proceso worker."""
+    global _worker_graph, _worker_version
+    if _worker_version == version:
+        return
+    if graph_file_version(graph_path) != version:
+        raise RuntimeError("El grafo cambió desde que se encoló el trabajo; vuelva a enviarlo.")
+    from graph.graph import Graph
+    graph = Graph()
+    with open(graph_path, 'rb') as f:
+        graph.graph = pickle.load(f)
+    _worker_graph, _worker_version = graph, version
+
+
+def _run_task(task: str, params: dict, graph_path: str, version: str,
+              cpu_limit: int, time_limit: int) -> dict:
+    """
+    Ejecuta una tarea en el worker aplicando los límites del trabajo:
+      - CPU: RLIMIT_CPU relativo al consumo acumulado del proceso (SIGXCPU).
+      - Tiempo: temporizador real (SIGALRM).
+    """
+    _load_worker_graph(graph_path, version)
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_soft = math.ceil(usage.ru_utime + usage.ru_stime) + cpu_limit
+    if hard != resource.RLIM_INFINITY:
+        cpu_soft = min(cpu_soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_soft, hard))
+    signal.setitimer(signal.ITIMER_REAL, time_limit)
+    try:
+        return TASKS[task](_worker_graph, **params)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+# --- Lado de los procesos de la API ---
+
+class JobManager:
+    """
+    Trabajos asíncronos compartidos por todos los procesos de la API del host
+    (p. ej. los workers de gunicorn):
+
+      - El estado y el resultado de cada trabajo viven en
+        job_dir/<versión del grafo>/<job_id>.json. El job_id se deriva de la
+        versión, la tarea y los parámetros, así que cualquier worker puede
+        consultarlo y la caché de resultados es común a todos.
+      - Solo un proceso del host ejecuta trabajos: el que obtiene el flock de
+        job_dir/runner.lock. Su hilo despachador recoge los trabajos pendientes
+        y los envía a un único pool de max_workers procesos, de modo que el
+        límite de procesos es por host y no por worker de gunicorn.
+      - El pool usa el contexto 'forkserver': sus procesos no nacen de un fork
+        de la API (que tiene hilos y podría heredar locks tomados), sino de un
+        servidor limpio. Cada proceso carga el grafo desde disco una vez.
+
+    Si el proceso despachador muere, el flock se libera y otro worker toma el
+    relevo en su siguiente petición, reencolando los trabajos a medias.
+    """
+
+    def __init__(self, job_dir: str, max_workers: int = 2, cpu_limit: int = 60,
+                 time_limit: int = 120, max_jobs: int = 256, poll_interval: float = 0.2):
+        self.job_dir = job_dir
+        self.max_workers = max_workers
+        self.cpu_limit = cpu_limit
+        self.time_limit = time_limit
+        self.max_jobs = max_jobs
+        self.poll_interval = poll_interval
+        self._graph_path = None
+        self._graph_version = None
+        self._executor = None
+        self._lock_fd = None
+        self._dispatcher = None
+        self._running = 0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def set_graph(self, graph_path: str, version: str):
+        """
+        Registra el grafo serializado sobre el que se ejecutan los trabajos y
+        descarta los resultados de versiones anteriores.
+        """
+        with self._lock:
+            self._graph_path = graph_path
+            self._graph_version = version
+        os.makedirs(self._version_dir(version), exist_ok=True)
+        for entry in os.listdir(self.job_dir):
+            path = os.path.join(self.job_dir, entry)
+            if entry != version and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def submit(self, task: str, **params) -> dict:
+        """Encola una tarea (o reutiliza un trabajo equivalente) y retorna su estado."""
+        if task not in TASKS:
+            raise ValueError(f"Tarea desconocida: {task}")
+        if self._graph_version is None:
+            raise RuntimeError("No hay un grafo registrado para ejecutar trabajos.")
+
+        version = self._graph_version
+        key = json.dumps([version, task, params], sort_keys=True)
+        job_id = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        path = self._job_path(version, job_id)
+        existing = self._read(path)
+        if existing is not None and existing["status"] != "failed":
+            job = existing
+        else:
+            # Los trabajos fallidos se reintentan al volver a enviarlos
+            job = {
+                "job_id": job_id,
+                "task": task,
+                "params": params,
+                "graph_version": version,
+                "status": "pending",
+                "submitted_at": time.time(),
+                "finished_at": None,
+                "result": None,
+                "error": None,
+            }
+            if self._write(path, job, exclusive=existing is None):
+                open(path[:-len(".json")] + ".pending", "w").close()
+                self._evict(version)
+            else:
+                # Otro worker lo creó a la vez: se usa el suyo
+                job = self._read(path) or job
+        self._ensure_dispatcher()
+        return self._describe(job)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Retorna el estado del trabajo (con su resultado si terminó) o None si no existe."""
+        self._ensure_dispatcher()
+        if self._graph_version is None:
+            return None
+        job = self._read(self._job_path(self._graph_version, job_id))
+        return self._describe(job) if job is not None else None
+
+    def shutdown(self):
+        """Detiene el despachador y el pool y libera el flock (para tests y cierre ordenado)."""
+        self._stop.set()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+            self._dispatcher = None
+
+    # --- Ficheros de trabajo ---
+
+    def _version_dir(self, version: str) -> str:
+        return os.path.join(self.job_dir, version)
+
+    def _job_path(self, version: str, job_id: str) -> str:
+        return os.path.join(self._version_dir(version), f"{job_id}.json")
+
+    @staticmethod
+    def _read(path: str) -> Optional[dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write(path: str, job: dict, exclusive: bool = False) -> bool:
+        """
+        Escribe el trabajo de forma atómica (fichero temporal + rename). Con
+        exclusive=True no sobrescribe uno existente y retorna False.
+        """
+        if exclusive and os.path.exists(path):
+            return False
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f)
+        if exclusive:
+            try:
+                os.link(tmp_path, path)
+                return True
+            except FileExistsError:
+                return False
+            finally:
+                os.unlink(tmp_path)
+        os.replace(tmp_path, path)
+        return True
+
+    def _evict(self, version: str):
+        """Descarta los trabajos terminados más antiguos si se supera max_jobs."""
+        directory = self._version_dir(version)
+        jobs = [e for e in os.scandir(directory) if e.name.endswith(".json")]
+        excess = len(jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        pending = {e.name[:-len(".pending")] for e in os.scandir(directory) if e.name.endswith(".pending")}
+        finished = [e for e in jobs if e.name[:-len(".json")] not in pending]
+        for entry in sorted(finished, key=lambda e: e.stat().st_mtime)[:excess]:
+            job = self._read(entry.path)
+            if job is not None and job["status"] in ("done", "failed"):
+                os.unlink(entry.path)
+
+    def _describe(self, job: dict) -> Dict:
+        description = {
+            "job_id": job["job_id"],
+            "task": job["task"],
+            "params": job["params"],
+            "graph_version": job["graph_version"],
+            "status": job["status"],
+        }
+        if job["status"] == "done":
+            description["result"] = job["result"]
+            description["elapsed"] = job["finished_at"] - job["submitted_at"]
+        elif job["status"] == "failed":
+            description["error"] = job["error"]
+        return description
+
+    # --- Despachador (solo en el proceso que tiene el flock) ---
+
+    def _ensure_dispatcher(self):
+        with self._lock:
+            if self._dispatcher is not None or self._graph_path is None:
+                return
+            os.makedirs(self.job_dir, exist_ok=True)
+            fd = os.open(os.path.join(self.job_dir, "runner.lock"), os.O_RDWR | os.O_CREAT)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return
+            self._lock_fd = fd
+            self._stop.clear()
+            self._requeue_orphans()
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="job-dispatcher", daemon=True)
+            self._dispatcher.start()
+
+    def _requeue_orphans(self):
+        """Los trabajos 'running' de un despachador anterior (ya muerto) vuelven a la cola."""
+        for version in os.listdir(self.job_dir):
+            directory = self._version_dir(version)
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if entry.name.endswith(".json"):
+                    job = self._read(entry.path)
+                    if job is not None and job["status"] == "running":
+                        open(entry.path[:-len(".json")] + ".pending", "w").close()
+
+    def _pending(self) -> List[str]:
+        """Rutas .pending de todas las versiones, las más antiguas primero."""
+        markers = []
+        for version in os.listdir(self.job_dir):
+            try:
+                for entry in os.scandir(self._version_dir(version)):
+                    if entry.name.endswith(".pending"):
+                        markers.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                # No es un directorio o lo borró set_graph() de otro worker
+                continue
+        return [path for _, path in sorted(markers)]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_init_worker
+            )
+        return self._executor
+
+    def _dispatch_loop(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self._dispatch_pending()
+            except Exception:
+                # El hilo no debe morir: mientras este proceso tenga el flock,
+                # ningún otro worker puede despachar trabajos
+                logger.exception("Error despachando trabajos; se reintenta en el siguiente ciclo.")
+
+    def _dispatch_pending(self):
+        """Envía al pool tantos trabajos pendientes como procesos libres tenga."""
+        for marker in self._pending():
+            with self._lock:
+                if self._running >= self.max_workers:
+                    return
+            path = marker[:-len(".pending")] + ".json"
+            job = self._read(path)
+            os.unlink(marker)
+            if job is None:
+                continue
+            job["status"] = "running"
+            self._write(path, job)
+            with self._lock:
+                executor = self._get_executor()
+                graph_path = self._graph_path
+                self._running += 1
+            try:
+                future = executor.submit(_run_task, job["task"], job["params"], graph_path,
+                                         job["graph_version"], self.cpu_limit, self.time_limit)
+            except Exception as exc:
+                # El pool se rompió antes de que _finish() lo descartara: se
+                # descarta aquí y el trabajo falla (reenviarlo lo reintenta)
+                with self._lock:
+                    self._running -= 1
+                    if self._executor is executor:
+                        self._executor.shutdown(wait=False, cancel_futures=True)
+                        self._executor = None
+                job["status"] = "failed"
+                job["finished_at"] = time.time()
+                job["error"] = str(exc) or type(exc).__name__
+                self._write(path, job)
+                logger.warning(f"No se pudo enviar el trabajo {job['job_id']} al pool: {job['error']}")
+                continue
+            future.add_done_callback(lambda f, p=path, e=executor: self._finish(p, e, f))
+
+    def _finish(self, path: str, executor: ProcessPoolExecutor, future):
+        with self._lock:
+            self._running -= 1
+        job = self._read(path)
+        if job is None:
+            return
+        job["finished_at"] = time.time()
+        if future.cancelled():
+            job["status"] = "failed"
+            job["error"] = "El trabajo fue cancelado."
+        elif future.exception() is not None:
+            exc = future.exception()
+            job["status"] = "failed"
+            job["error"] = str(exc) or type(exc).__name__
+            # Un worker muerto (p. ej. por el límite duro de CPU) rompe el pool
+            if isinstance(exc, BrokenProcessPool):
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor.shutdown(wait=False, cancel_futures=True)
+                        self._executor = None
+        else:
+            job["status"] = "done"
+            job["result"] = future.result()
+        self._write(path, job)
@@ -0,0 +1,91 @@
+import pickle
+import time
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+from graph.graph import Graph
+from api.jobs import JobManager, graph_file_version
+
+def wait_for(manager, job_id, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(job_id)
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"El trabajo {job_id} no terminó a tiempo")
+
+class TestJobManager:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        graph = Graph()
+        graph.add_edge("cat", "cot")
+        graph.add_edge("cot", "dot")
+        graph.add_node("bee")
+        self.graph_path = str(tmp_path / "graph.pkl")
+        with open(self.graph_path, 'wb') as f:
+            pickle.dump(graph.graph, f)
+        self.job_dir = str(tmp_path / "jobs")
+        self.version = graph_file_version(self.graph_path)
+        self.manager = self.new_manager()
+        yield
+        self.manager.shutdown()
+
+    def new_manager(self):
+        manager = JobManager(job_dir=self.job_dir, max_workers=1, poll_interval=0.05)
+        manager.set_graph(self.graph_path, self.version)
+        return manager
+
+    def test_job_runs_in_pool(self):
+        job = self.manager.submit("maximum-distance")
+        done = wait_for(self.manager, job["job_id"])
+        assert done["status"] == "done"
+        assert done["result"] == {"maximum_distance": 2}
+
+    def test_results_cached_per_graph_version(self):
+        first = self.manager.submit("all-paths", word1="cat", word2="dot", max_depth=5)
+        wait_for(self.manager, first["job_id"])
+        again = self.manager.submit("all-paths", word1="cat", word2="dot", max_depth=5)
+        assert again["job_id"] == first["job_id"]
+        assert again["result"]["paths"] == [["cat", "cot", "dot"]]
+
+        self.manager.set_graph(self.graph_path, "v2")
+        other = self.manager.submit("all-paths", word1="cat", word2="dot", max_depth=5)
+        assert other["job_id"] != first["job_id"]
+        # El grafo en disco no es la versión 'v2': el trabajo falla en lugar de mezclar versiones
+        assert wait_for(self.manager, other["job_id"])["status"] == "failed"
+
+    def test_jobs_shared_between_api_processes(self):
+        # Dos JobManager sobre el mismo directorio simulan dos workers de gunicorn
+        other = self.new_manager()
+        try:
+            job = self.manager.submit("maximum-distance")
+            done = wait_for(other, job["job_id"])
+            assert done["result"] == {"maximum_distance": 2}
+            # Solo uno de los dos tiene el flock y ejecuta trabajos
+            assert (self.manager._dispatcher is None) != (other._dispatcher is None)
+        finally:
+            other.shutdown()
+
+    def test_unknown_task(self):
+        with pytest.raises(ValueError):
+            self.manager.submit("no-existe")
+
+    def test_dispatcher_survives_broken_pool_on_submit(self):
+        class BrokenPool:
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("pool roto")
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+
+        self.manager._executor = BrokenPool()
+        broken = self.manager.submit("maximum-distance")
+        failed = wait_for(self.manager, broken["job_id"])
+        assert failed["status"] == "failed"
+        assert "pool roto" in failed["error"]
+        # El pool roto se descarta y el hilo sigue despachando con uno nuevo
+        assert self.manager._dispatcher.is_alive()
+        job = self.manager.submit("clusters")
+        assert wait_for(self.manager, job["job_id"])["status"] == "done"
+        # Reenviar el trabajo fallido lo reintenta
+        retried = self.manager.submit("maximum-distance")
+        assert wait_for(self.manager, retried["job_id"])["result"] == {"maximum_distance": 2}
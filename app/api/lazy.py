@@ -0,0 +1,20 @@
+# api/lazy.py
+
+import importlib.util
+import sys
+
+
+def lazy_import(name: str):
+    """
+    Importa un módulo de forma diferida: se registra en sys.modules pero su
+    código no se ejecuta hasta el primer acceso a uno de sus atributos.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,89 @@
+# api/responses.py
+
+import gzip
+import json
+import zlib
+from typing import Callable, Dict, Hashable
+
+from flask import Response, request
+
+from api.cache import VersionedLRU
+from config import COMPRESS_MIN_BYTES
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa el módulo json estándar
+    orjson = None
+
+ENCODINGS = ["gzip", "deflate"]
+
+
+def dumps(payload) -> bytes:
+    """Serializa a JSON (claves ordenadas, como jsonify) con orjson si está disponible."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return zlib.compress(body, 6)
+
+
+class EncodedBody:
+    """Cuerpo JSON ya serializado, con sus versiones comprimidas calculadas bajo demanda."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self._compressed: Dict[str, bytes] = {}
+
+    def encoded(self, encoding: str) -> bytes:
+        data = self._compressed.get(encoding)
+        if data is None:
+            data = self._compressed[encoding] = compress(self.body, encoding)
+        return data
+
+    def to_response(self, status: int = 200) -> Response:
+        """
+        Construye la respuesta negociando gzip/deflate con Accept-Encoding.
+        Los cuerpos menores que COMPRESS_MIN_BYTES se envían sin comprimir.
+        """
+        encoding = None
+        if len(self.body) >= COMPRESS_MIN_BYTES:
+            encoding = request.accept_encodings.best_match(ENCODINGS)
+        response = Response(self.encoded(encoding) if encoding else self.body,
+                            status=status, mimetype="application/json")
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        return response
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """Sustituto de jsonify con serializador rápido y compresión negociada."""
+    return EncodedBody(dumps(payload)).to_response(status)
+
+
+class ResponseCache:
+    """
+    Respuestas estáticas (dependen solo del grafo) serializadas una única vez
+    por versión del grafo. Guarda también las variantes comprimidas, de modo
+    que las peticiones siguientes no pagan ni la serialización ni el gzip.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self._entries = VersionedLRU(max_entries)
+
+    def set_version(self, version: str):
+        self._entries.set_version(version)
+
+    def respond(self, key: Hashable, build: Callable[[], dict]) -> Response:
+        """Responde con el cuerpo cacheado para 'key' o lo construye con build()."""
+        version = self._entries.version
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = EncodedBody(dumps(build()))
+            # Si el grafo cambió mientras se construía no se cachea
+            self._entries.put(key, entry, version)
+        return entry.to_response()
@@ -0,0 +1,40 @@
+import gzip
+import json
+from flask import Flask
+from api.responses import ResponseCache, json_response
+from config import COMPRESS_MIN_BYTES
+
+app = Flask(__name__)
+BIG = {"nodes": ["word%d" % i for i in range(COMPRESS_MIN_BYTES)]}
+
+class TestResponses:
+    def test_gzip_negotiated_above_threshold(self):
+        with app.test_request_context(headers={"Accept-Encoding": "gzip, deflate"}):
+            response = json_response(BIG)
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert json.loads(gzip.decompress(response.get_data())) == BIG
+
+    def test_small_or_unaccepted_bodies_not_compressed(self):
+        with app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+            assert "Content-Encoding" not in json_response({"path": ["cat"]}).headers
+        with app.test_request_context():
+            response = json_response(BIG)
+        assert "Content-Encoding" not in response.headers
+        assert json.loads(response.get_data()) == BIG
+
+    def test_cache_encodes_once_per_version(self):
+        cache = ResponseCache()
+        cache.set_version("v1")
+        calls = []
+        def build():
+            calls.append(1)
+            return BIG
+        with app.test_request_context(headers={"Accept-Encoding": "deflate"}):
+            first = cache.respond(("nodes",), build)
+            second = cache.respond(("nodes",), build)
+            assert first.get_data() == second.get_data()
+            assert len(calls) == 1
+            cache.set_version("v2")
+            cache.respond(("nodes",), build)
+            assert len(calls) == 2
@@ -0,0 +1,54 @@
+# api/visualization.py
+
+from typing import Tuple
+
+from api.cache import VersionedLRU
+
+MIMETYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+
+class NeighbourhoodRenderer:
+    """
+    Renderiza el vecindario (ego-subgrafo) de una palabra en el servidor.
+
+    Los layouts se cachean por (palabra, radio) y las imágenes por
+    (palabra, radio, formato); ambas cachés se invalidan al cambiar la versión
+    del grafo, así que tras la primera petición servir una imagen no cuesta
+    ni el layout ni el dibujo.
+    """
+
+    def __init__(self, max_nodes: int = 150, max_entries: int = 128):
+        self.max_nodes = max_nodes
+        self._layouts = VersionedLRU(max_entries)
+        self._images = VersionedLRU(max_entries)
+
+    def set_version(self, version: str):
+        self._layouts.set_version(version)
+        self._images.set_version(version)
+
+    def render(self, graph, word: str, radius: int, fmt: str) -> Tuple[bytes, int]:
+        """
+        Retorna (imagen, número_de_nodos) del vecindario de 'word'. Lanza
+        nx.NodeNotFound si la palabra no está en el grafo.
+        """
+        version = self._images.version
+        rendered = self._images.get((word, radius, fmt))
+        if rendered is not None:
+            return rendered
+
+        # Importaciones pesadas solo en la primera visualización
+        from graph.graph_analyzer import GraphAnalyzer
+        from graph.node import Node
+
+        analyzer = GraphAnalyzer(graph.graph)
+        center = Node(word)
+        cached_layout = self._layouts.get((word, radius))
+        if cached_layout is None:
+            subgraph = analyzer.ego_subgraph(center, radius, self.max_nodes)
+            cached_layout = (subgraph, analyzer.layout(subgraph))
+            self._layouts.put((word, radius), cached_layout, version)
+        subgraph, pos = cached_layout
+
+        rendered = (analyzer.render(subgraph, pos, fmt, center=center), subgraph.number_of_nodes())
+        self._images.put((word, radius, fmt), rendered, version)
+        return rendered
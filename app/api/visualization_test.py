@@ -0,0 +1,33 @@
+import pytest
+import networkx as nx
+from graph.graph_analyzer import GraphAnalyzer
+from graph.node import Node
+from api.visualization import NeighbourhoodRenderer
+
+class TestVisualization:
+    def test_ego_subgraph_is_bounded(self, ladder_graph):
+        analyzer = GraphAnalyzer(ladder_graph.graph)
+        ego = analyzer.ego_subgraph(Node("card"), radius=1)
+        assert set(ego.nodes) == {Node("card"), Node("cord"), Node("ward")}
+        assert analyzer.ego_subgraph(Node("card"), radius=3, max_nodes=2).number_of_nodes() == 2
+
+    def test_render_png_and_svg(self, ladder_graph):
+        renderer = NeighbourhoodRenderer()
+        renderer.set_version("v1")
+        graph = ladder_graph
+        png, nodes = renderer.render(graph, "card", 1, "png")
+        assert png.startswith(b"\x89PNG")
+        assert nodes == 3
+        svg, _ = renderer.render(graph, "card", 1, "svg")
+        assert b"<svg" in svg
+        with pytest.raises(nx.NodeNotFound):
+            renderer.render(graph, "zzzz", 1, "png")
+
+    def test_images_cached_per_graph_version(self, ladder_graph):
+        renderer = NeighbourhoodRenderer()
+        renderer.set_version("v1")
+        graph = ladder_graph
+        first = renderer.render(graph, "card", 2, "png")
+        assert renderer.render(graph, "card", 2, "png") is first
+        renderer.set_version("v2")
+        assert renderer.render(graph, "card", 2, "png") is not first
@@ -0,0 +1,60 @@
+# benchmark_responses.py
+
+import argparse
+import json
+import time
+
+from flask import jsonify
+
+from api import api
+
+ENDPOINTS = [
+    "/clusters",
+    "/nodes-by-degree?degree=1",
+    "/high-connectivity?degree=2",
+    "/isolated-nodes",
+]
+
+
+def cpu_ms(fn, repeat: int) -> float:
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) * 1000 / repeat
+
+
+def main(repeat: int):
+    """
+    Para cada endpoint estático muestra los bytes enviados (sin comprimir y
+    con gzip) y el CPU por respuesta: la primera petición (serializa y
+    comprime), las siguientes (servidas desde la caché) y, como referencia,
+    el coste de serializar el mismo cuerpo con jsonify.
+    """
+    if not api.ensure_graph():
+        print("No hay grafo cargado: ejecute initialize_graph.py primero.")
+        return
+
+    app, response_cache = api.app, api.response_cache
+    client = app.test_client()
+    gzip_headers = {"Accept-Encoding": "gzip"}
+    print(f"{'endpoint':32} {'bytes':>10} {'gzip':>10} {'jsonify ms':>11} {'1ª ms':>8} {'cache ms':>9}")
+    for url in ENDPOINTS:
+        response_cache.set_version(None)
+        response_cache.set_version(api.graph_version)
+        cold = cpu_ms(lambda: client.get(url, headers=gzip_headers), 1)
+        warm = cpu_ms(lambda: client.get(url, headers=gzip_headers), repeat)
+
+        plain = client.get(url, headers={"Accept-Encoding": "identity"}).get_data()
+        compressed = client.get(url, headers=gzip_headers).get_data()
+        payload = json.loads(plain)
+        with app.test_request_context(url):
+            reference = cpu_ms(lambda: jsonify(payload), repeat)
+
+        print(f"{url:32} {len(plain):>10} {len(compressed):>10} {reference:>11.2f} {cold:>8.2f} {warm:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mide bytes y CPU por respuesta de los endpoints estáticos.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.repeat)
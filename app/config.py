@@ -1,6 +1,7 @@
 # app/config.py
 
 import os
+import tempfile
 
 # Obtener la ruta absoluta del directorio actual (app/)
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,4 +11,25 @@ PROJECT_ROOT = os.path.dirname(current_dir)
 
 # Definir las rutas hacia datalake y datamart
 DATA_LAKE_PATH = os.path.join(PROJECT_ROOT, "datalake")
-DATA_MART_PATH = os.path.join(PROJECT_ROOT, "datamart")
\ No newline at end of file
+DATA_MART_PATH = os.path.join(PROJECT_ROOT, "datamart")
+
+# Límites del pool de procesos para los trabajos asíncronos de la API
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 2))
+JOB_CPU_LIMIT = int(os.environ.get("JOB_CPU_LIMIT", 60))
+JOB_TIME_LIMIT = int(os.environ.get("JOB_TIME_LIMIT", 120))
+# Directorio compartido por todos los workers de la API con el estado y los
+# resultados de los trabajos (JOB_WORKERS limita los procesos de todo el host)
+JOB_DIR = os.environ.get("JOB_DIR", os.path.join(tempfile.gettempdir(), "graphword-jobs"))
+
+# Tamaño mínimo (bytes) a partir del cual las respuestas JSON se comprimen
+COMPRESS_MIN_BYTES = int(os.environ.get("COMPRESS_MIN_BYTES", 1024))
+
+# Arranque de la API: con API_LAZY_STARTUP=1 el grafo (y networkx) se cargan
+# con la primera petición en lugar de al importar el módulo
+API_LAZY_STARTUP = os.environ.get("API_LAZY_STARTUP", "0") == "1"
+API_LOG_FILE = os.environ.get("API_LOG_FILE", "app.log")
+API_BOOT_BUDGET_MS = int(os.environ.get("API_BOOT_BUDGET_MS", 500))
+
+# Límites de /visualize: radio máximo y nodos máximos por imagen
+VISUALIZE_MAX_RADIUS = int(os.environ.get("VISUALIZE_MAX_RADIUS", 3))
+VISUALIZE_MAX_NODES = int(os.environ.get("VISUALIZE_MAX_NODES", 150))
@@ -0,0 +1,40 @@
+import os
+import pickle
+import pytest
+
+# Las pruebas de la API no cargan app/graph.pkl al importarla ni escriben app.log
+os.environ.setdefault("API_LAZY_STARTUP", "1")
+os.environ.setdefault("API_LOG_FILE", "")
+
+from graph.graph import Graph
+
+@pytest.fixture
+def ladder_graph():
+    """Escalera cold -> cord -> card -> ward -> warm (+ worm, word) y la componente bee - bed."""
+    graph = Graph()
+    for w in ["cold", "cord", "card", "ward", "warm", "worm", "word", "bee", "bed"]:
+        graph.add_node(w)
+    graph.connect_words()
+    return graph
+
+@pytest.fixture
+def api_client(ladder_graph, tmp_path, monkeypatch):
+    """Cliente de pruebas de Flask con ladder_graph como grafo cargado y trabajos en tmp_path."""
+    from api import api
+    from api.jobs import JobManager, graph_file_version
+
+    graph_path = str(tmp_path / "graph.pkl")
+    with open(graph_path, 'wb') as f:
+        pickle.dump(ladder_graph.graph, f)
+    version = graph_file_version(graph_path)
+    manager = JobManager(job_dir=str(tmp_path / "jobs"), max_workers=1, poll_interval=0.05)
+    manager.set_graph(graph_path, version)
+
+    monkeypatch.setattr(api, "graph", ladder_graph)
+    monkeypatch.setattr(api, "is_initialized", True)
+    monkeypatch.setattr(api, "graph_version", version)
+    monkeypatch.setattr(api, "job_manager", manager)
+    api.response_cache.set_version(version)
+    api.renderer.set_version(version)
+    yield api.app.test_client()
+    manager.shutdown()
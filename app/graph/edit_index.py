@@ -0,0 +1,112 @@
+# graph/edit_index.py
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+def deletes(word: str, max_distance: int) -> Set[str]:
+    """
+    Vecindario de borrados: todas las cadenas obtenidas eliminando hasta
+    'max_distance' letras de 'word' (incluida la propia palabra).
+    """
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for w in frontier:
+            for i in range(len(w)):
+                next_frontier.add(w[:i] + w[i + 1:])
+        next_frontier -= result
+        result |= next_frontier
+        frontier = next_frontier
+    return result
+
+
+def levenshtein(w1: str, w2: str, max_distance: int) -> int:
+    """
+    Distancia de Levenshtein acotada: retorna max_distance + 1 en cuanto
+    se sabe que la distancia real la supera.
+    """
+    if abs(len(w1) - len(w2)) > max_distance:
+        return max_distance + 1
+    if len(w1) > len(w2):
+        w1, w2 = w2, w1
+    previous = list(range(len(w1) + 1))
+    for j, c2 in enumerate(w2, 1):
+        current = [j]
+        for i, c1 in enumerate(w1, 1):
+            current.append(min(
+                previous[i] + 1,
+                current[i - 1] + 1,
+                previous[i - 1] + (c1 != c2)
+            ))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+class DeletionIndex:
+    """
+    Índice de vecindarios de borrados (estilo SymSpell) sobre un vocabulario.
+
+    Dos palabras a distancia de Levenshtein <= k comparten siempre alguna
+    cadena obtenida borrando como mucho k letras de cada una, así que basta
+    con consultar los borrados de la palabra buscada y verificar los
+    candidatos, sin comparar todos los pares.
+
+    Los cubos se guardan aplanados: cada borrado apunta a un tramo
+    [_offsets[b], _offsets[b + 1]) del array de índices de palabra '_ids'.
+    """
+
+    def __init__(self, words: Iterable[str], max_distance: int = 1):
+        self.max_distance = max_distance
+        self.words: List[str] = sorted(set(words))
+        buckets: Dict[str, List[int]] = {}
+        for idx, word in enumerate(self.words):
+            for key in deletes(word, max_distance):
+                buckets.setdefault(key, []).append(idx)
+
+        self._buckets: Dict[str, int] = {}
+        self._offsets = array("I", [0])
+        self._ids = array("I")
+        for bucket, (key, ids) in enumerate(buckets.items()):
+            self._buckets[key] = bucket
+            self._ids.extend(ids)
+            self._offsets.append(len(self._ids))
+
+    def __len__(self):
+        return len(self.words)
+
+    def _candidates(self, word: str, distance: int) -> Set[int]:
+        candidates = set()
+        for key in deletes(word, distance):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                candidates.update(self._ids[self._offsets[bucket]:self._offsets[bucket + 1]])
+        return candidates
+
+    def neighbors(self, word: str, distance: int = 1) -> List[Tuple[str, int]]:
+        """
+        Retorna [(palabra, distancia)] del vocabulario a distancia 1..distance
+        de 'word', ordenadas por distancia y alfabéticamente.
+        """
+        if distance > self.max_distance:
+            raise ValueError(f"La distancia máxima del índice es {self.max_distance}.")
+        result = []
+        for idx in self._candidates(word, distance):
+            candidate = self.words[idx]
+            d = levenshtein(word, candidate, distance)
+            if 0 < d <= distance:
+                result.append((candidate, d))
+        result.sort(key=lambda item: (item[1], item[0]))
+        return result
+
+    def pairs_within(self, distance: int = 1) -> Iterator[Tuple[str, str]]:
+        """Genera cada par de palabras del vocabulario a distancia 1..distance una sola vez."""
+        if distance > self.max_distance:
+            raise ValueError(f"La distancia máxima del índice es {self.max_distance}.")
+        for idx, word in enumerate(self.words):
+            for other in self._candidates(word, distance):
+                if other > idx and 0 < levenshtein(word, self.words[other], distance) <= distance:
+                    yield word, self.words[other]
@@ -0,0 +1,35 @@
+import pytest
+from graph.edit_index import DeletionIndex, deletes, levenshtein
+from graph.graph import Graph
+
+class TestDeletionIndex:
+    def test_deletes(self):
+        assert deletes("cat", 1) == {"cat", "at", "ct", "ca"}
+
+    def test_levenshtein_bounded(self):
+        assert levenshtein("cat", "cart", 2) == 1
+        assert levenshtein("cat", "dog", 1) == 2  # acotada a max_distance + 1
+
+    def test_neighbors_across_lengths(self):
+        index = DeletionIndex(["cat", "cart", "card", "cot", "dog"], max_distance=2)
+        assert index.neighbors("cat", 1) == [("cart", 1), ("cot", 1)]
+        assert ("card", 2) in index.neighbors("cat", 2)
+        with pytest.raises(ValueError):
+            index.neighbors("cat", 3)
+
+    def test_pairs_within(self):
+        index = DeletionIndex(["cat", "cart", "card", "dog"], max_distance=1)
+        assert sorted(index.pairs_within(1)) == [("card", "cart"), ("cart", "cat")]
+
+    def test_index_saved_apart_from_graph(self, tmp_path):
+        graph = Graph()
+        for w in ["cat", "cot", "dog"]:
+            graph.add_node(w)
+        graph.connect_words()
+        assert "edit_index" not in graph.graph.graph
+        graph.save_edit_index(str(tmp_path / "edit_index.pkl"))
+
+        restored = Graph()
+        restored.graph = graph.graph
+        restored.load_edit_index(str(tmp_path / "edit_index.pkl"))
+        assert restored.edit_neighbors("cat") == [("cot", 1)]
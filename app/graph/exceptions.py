@@ -0,0 +1,4 @@
+# graph/exceptions.py
+class MissingIndexException(Exception):
+    """Falta un índice que genera initialize_graph (error de despliegue, no de la petición)."""
+    pass
@@ -1,11 +1,22 @@
 # graph/graph.py
 
+import pickle
 import networkx as nx
 from .node import Node
+from .exceptions import MissingIndexException
+from .edit_index import DeletionIndex
+from .word_dawg import WordDawg
+from .landmarks import LandmarkOracle, MIN_COMPONENT_SIZE
 
 class Graph:
-    def __init__(self):
-        self.graph = nx.Graph()
+    def __init__(self, allow_indels: bool = False):
+        # allow_indels: modo generalizado en el que también se enlazan palabras
+        # de longitudes contiguas a distancia de Levenshtein 1 (cat -> cart).
+        # Se guarda como atributo del grafo para que viaje con el pickle.
+        self.graph = nx.Graph(allow_indels=allow_indels)
+        # Índice de borrados: no forma parte del grafo serializado; se guarda
+        # en su propio fichero y se carga bajo demanda (load_edit_index)
+        self.edit_index = None
 
     def add_node(self, word: str):
         n = Node(word)
@@ -26,12 +37,102 @@ class Graph:
 
     def _is_one_letter_apart(self, w1, w2):
         if len(w1) != len(w2):
-            return False
+            if not self.graph.graph.get("allow_indels", False) or abs(len(w1) - len(w2)) != 1:
+                return False
+            short, long = (w1, w2) if len(w1) < len(w2) else (w2, w1)
+            return any(long[:i] + long[i + 1:] == short for i in range(len(long)))
         return sum(a != b for a, b in zip(w1, w2)) == 1
 
+    def build_edit_index(self, max_distance: int = 1) -> DeletionIndex:
+        """Construye el índice de borrados sobre las palabras del grafo."""
+        self.edit_index = DeletionIndex((n.word for n in self.graph.nodes), max_distance)
+        return self.edit_index
+
+    def save_edit_index(self, path: str):
+        with open(path, 'wb') as f:
+            pickle.dump(self.edit_index, f)
+
+    def load_edit_index(self, path: str) -> DeletionIndex:
+        with open(path, 'rb') as f:
+            self.edit_index = pickle.load(f)
+        return self.edit_index
+
+    def connect_words(self) -> int:
+        """
+        Añade todas las aristas entre las palabras del grafo usando el índice de
+        borrados en lugar de comparar todos los pares. Retorna las aristas nuevas.
+        """
+        index = self.edit_index
+        if index is None or len(index) != self.graph.number_of_nodes():
+            index = self.build_edit_index(index.max_distance if index else 1)
+        total_edges = 0
+        for w1, w2 in index.pairs_within(1):
+            if self.add_edge(w1, w2):
+                total_edges += 1
+        return total_edges
+
+    def edit_neighbors(self, word: str, distance: int = 1):
+        """Palabras del vocabulario a distancia de Levenshtein <= distance de 'word'."""
+        if self.edit_index is None:
+            raise MissingIndexException("El grafo no tiene índice de borrados; ejecute initialize_graph.")
+        return self.edit_index.neighbors(word, distance)
+
+    def build_word_index(self) -> WordDawg:
+        """Construye el DAWG del vocabulario para búsquedas por patrón y lo guarda en el grafo."""
+        dawg = WordDawg(n.word for n in self.graph.nodes)
+        self.graph.graph["word_dawg"] = dawg
+        return dawg
+
+    def match_words(self, pattern: str, limit: int = 100, max_visits: int = 50000):
+        """Palabras que encajan con 'pattern' ('_' una letra, '*' cualquier sufijo o tramo)."""
+        dawg = self.graph.graph.get("word_dawg")
+        if dawg is None:
+            raise MissingIndexException("El grafo no tiene índice de palabras; ejecute initialize_graph.")
+        return dawg.match(pattern, limit, max_visits)
+
+    def build_landmarks(self, k: int = 4, min_component_size: int = MIN_COMPONENT_SIZE) -> LandmarkOracle:
+        """Elige k landmarks por componente grande y guarda sus distancias BFS en el grafo."""
+        oracle = LandmarkOracle(self.graph, k, min_component_size)
+        self.graph.graph["landmarks"] = oracle
+        return oracle
+
+    def _landmark_bounds(self, w1: str, w2: str):
+        oracle = self.graph.graph.get("landmarks")
+        if oracle is None:
+            return None
+        return oracle.bounds(w1, w2)
+
     def shortest_path(self, w1: str, w2: str):
+        # Si los landmarks sitúan las palabras en componentes distintas no hace falta buscar
+        if self._landmark_bounds(w1, w2) == (None, None):
+            raise nx.NetworkXNoPath(f"No hay camino entre {w1} y {w2}.")
         return nx.shortest_path(self.graph, Node(w1), Node(w2))
 
+    def distance(self, w1: str, w2: str) -> int:
+        """
+        Distancia exacta (número de pasos) entre dos palabras. Cuando las cotas
+        de los landmarks coinciden se responde sin recorrer el grafo.
+        """
+        bounds = self._landmark_bounds(w1, w2)
+        if bounds == (None, None):
+            raise nx.NetworkXNoPath(f"No hay camino entre {w1} y {w2}.")
+        if bounds is not None and bounds[0] == bounds[1]:
+            return bounds[0]
+        return len(nx.bidirectional_shortest_path(self.graph, Node(w1), Node(w2))) - 1
+
+    def distance_bounds(self, w1: str, w2: str):
+        """
+        (cota_inferior, cota_superior) de la distancia según los landmarks. Para
+        palabras fuera de las componentes indexadas (pequeñas) se calcula la exacta.
+        """
+        bounds = self._landmark_bounds(w1, w2)
+        if bounds == (None, None):
+            raise nx.NetworkXNoPath(f"No hay camino entre {w1} y {w2}.")
+        if bounds is None:
+            d = self.distance(w1, w2)
+            return d, d
+        return bounds
+
     def clusters(self):
         return list(nx.connected_components(self.graph))
 
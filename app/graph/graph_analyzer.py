@@ -1,8 +1,8 @@
 # graph/graph_analyzer.py
 
+import io
 import networkx as nx
-from typing import Optional, List
-import matplotlib.pyplot as plt
+from typing import Dict, Optional, List
 
 class GraphAnalyzer:
     """
@@ -13,6 +13,7 @@ class GraphAnalyzer:
       - Clústeres
       - Nodos con cierto grado de conectividad
       - Nodos aislados
+      - Visualización (local o renderizada a PNG/SVG)
     """
 
     def __init__(self, graph: nx.Graph):
@@ -117,6 +118,9 @@ class GraphAnalyzer:
         """
         Dibuja el grafo usando matplotlib. El layout por defecto es 'spring_layout'.
         """
+        # matplotlib se importa aquí: es caro y solo lo necesita la visualización
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 8))  # Ajusta el tamaño a tu gusto
         pos = nx.spring_layout(self.graph)  # Calcula posiciones para cada nodo
         
@@ -148,3 +152,54 @@ class GraphAnalyzer:
         # Muestra la ventana con el grafo
         plt.title("Visualización del Grafo")
         plt.show()
+
+    def ego_subgraph(self, center, radius: int = 1, max_nodes: int = 150) -> nx.Graph:
+        """
+        Subgrafo con los nodos a distancia <= radius de 'center', recorridos en
+        anchura y limitado a 'max_nodes' (los más cercanos primero).
+        """
+        if center not in self.graph:
+            raise nx.NodeNotFound(f"El nodo {center} no está en el grafo.")
+        seen = {center}
+        frontier = [center]
+        for _ in range(radius):
+            next_frontier = []
+            for node in frontier:
+                for neighbor in self.graph[node]:
+                    if neighbor in seen:
+                        continue
+                    if len(seen) >= max_nodes:
+                        return self.graph.subgraph(seen)
+                    seen.add(neighbor)
+                    next_frontier.append(neighbor)
+            frontier = next_frontier
+        return self.graph.subgraph(seen)
+
+    def layout(self, subgraph: nx.Graph, seed: int = 42) -> Dict:
+        """Posiciones 'spring_layout' de un subgrafo (semilla fija: siempre el mismo dibujo)."""
+        return nx.spring_layout(subgraph, seed=seed)
+
+    def render(self, subgraph: nx.Graph, pos: Dict, fmt: str = "png", center=None,
+               show_labels: bool = True) -> bytes:
+        """
+        Dibuja un subgrafo con el backend Agg (sin pantalla) y retorna la imagen
+        en 'png' o 'svg'. El nodo 'center', si se indica, se resalta.
+        """
+        # Figure + FigureCanvasAgg no dependen del estado global de pyplot
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        figure = Figure(figsize=(8, 6))
+        FigureCanvasAgg(figure)
+        ax = figure.add_subplot()
+        colors = ['orange' if n == center else 'lightblue' for n in subgraph.nodes]
+        nx.draw_networkx_nodes(subgraph, pos, ax=ax, node_color=colors, node_size=500, alpha=0.8)
+        nx.draw_networkx_edges(subgraph, pos, ax=ax, edge_color='gray')
+        if show_labels:
+            labels = {n: getattr(n, 'word', n) for n in subgraph.nodes}
+            nx.draw_networkx_labels(subgraph, pos, labels=labels, ax=ax, font_size=10, font_color='black')
+        ax.axis('off')
+
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format=fmt, bbox_inches='tight')
+        return buffer.getvalue()
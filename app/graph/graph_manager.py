@@ -8,17 +8,16 @@ class GraphManager:
     Encargado de construir el grafo a partir de una lista de palabras
     y exponer la instancia de Graph.
     """
-    def __init__(self):
-        self.graph_obj = Graph()
+    def __init__(self, allow_indels: bool = False):
+        self.graph_obj = Graph(allow_indels=allow_indels)
 
     def build_graph(self, words: List[str]):
         """
         Crea el grafo añadiendo todos los nodos y edges (diferencia de una letra).
         """
-        for i, w1 in enumerate(words):
-            self.graph_obj.add_node(w1)
-            for w2 in words[i+1:]:
-                self.graph_obj.add_edge(w1, w2)
+        for w in words:
+            self.graph_obj.add_node(w)
+        self.graph_obj.connect_words()
 
     def get_graph(self) -> Graph:
         return self.graph_obj
@@ -98,3 +98,13 @@ class TestGraph:
         isolated_nodes = graph.isolated_nodes()
         assert Node("bat") in isolated_nodes  # "bat" está aislado
         assert Node("dog") not in isolated_nodes  # "dog" tiene una conexión
+
+    def test_indel_ladder(self):
+        graph = Graph(allow_indels=True)
+        for w in ["cat", "cart", "card"]:
+            graph.add_node(w)
+        graph.connect_words()
+
+        # Con inserciones/borrados el camino cruza longitudes: cat -> cart -> card
+        assert graph.shortest_path("cat", "card") == [Node("cat"), Node("cart"), Node("card")]
+        assert not Graph().add_edge("cat", "cart")
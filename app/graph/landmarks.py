@@ -0,0 +1,111 @@
+# graph/landmarks.py
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import networkx as nx
+
+# Valor de las distancias en array('H') para nodos inalcanzables (no ocurre
+# dentro de una componente, pero delimita el rango representable)
+UNREACHABLE = 0xFFFF
+
+# Tamaño mínimo de componente con landmarks: en las pequeñas un BFS ya es barato
+MIN_COMPONENT_SIZE = 1000
+
+
+class LandmarkOracle:
+    """
+    Oráculo de distancias por landmarks (cotas ALT por desigualdad triangular).
+
+    Para cada componente con al menos 'min_component_size' nodos se eligen
+    'k' palabras landmark (selección del punto más lejano) y se guardan sus
+    distancias BFS a todos los nodos de la componente. Por la desigualdad
+    triangular, para cualquier landmark L:
+
+        |d(L, a) - d(L, b)|  <=  d(a, b)  <=  d(L, a) + d(L, b)
+
+    lo que da cotas inmediatas sin recorrer el grafo.
+    """
+
+    def __init__(self, graph: nx.Graph, k: int = 4, min_component_size: int = MIN_COMPONENT_SIZE):
+        self.k = k
+        self.min_component_size = min_component_size
+        self._index: Dict[str, int] = {}
+        self._component = array("I")
+        self._starts: List[int] = []
+        self._landmarks: List[List[str]] = []
+        self._distances: List[List[array]] = []
+
+        for component in nx.connected_components(graph):
+            if len(component) < max(min_component_size, 2):
+                continue
+            self._add_component(graph, component)
+
+    def _add_component(self, graph: nx.Graph, component):
+        comp_id = len(self._starts)
+        start = len(self._component)
+        nodes = list(component)
+        for pos, node in enumerate(nodes):
+            self._index[node.word] = start + pos
+            self._component.append(comp_id)
+        self._starts.append(start)
+
+        landmarks, distances = [], []
+        # El primer landmark es el nodo más lejano de uno cualquiera; los
+        # siguientes, el que maximiza la distancia mínima a los ya elegidos
+        lengths = nx.single_source_shortest_path_length(graph, nodes[0])
+        closest = [lengths[node] for node in nodes]
+        for _ in range(min(self.k, len(nodes))):
+            candidate = max(range(len(nodes)), key=closest.__getitem__)
+            if closest[candidate] == 0 and landmarks:
+                break
+            landmark = nodes[candidate]
+            lengths = nx.single_source_shortest_path_length(graph, landmark)
+            dist = array("H", (min(lengths[node], UNREACHABLE) for node in nodes))
+            landmarks.append(landmark.word)
+            distances.append(dist)
+            closest = [min(c, d) for c, d in zip(closest, dist)]
+        self._landmarks.append(landmarks)
+        self._distances.append(distances)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._index
+
+    @property
+    def landmarks(self) -> List[str]:
+        return [w for landmarks in self._landmarks for w in landmarks]
+
+    def _locate(self, word: str) -> Optional[Tuple[int, int]]:
+        i = self._index.get(word)
+        if i is None:
+            return None
+        comp = self._component[i]
+        return comp, i - self._starts[comp]
+
+    def profile(self, word: str) -> Optional[Tuple[int, Tuple[int, ...]]]:
+        """(componente, distancias a sus landmarks) de 'word', o None si no está indexada."""
+        where = self._locate(word)
+        if where is None:
+            return None
+        comp, pos = where
+        return comp, tuple(d[pos] for d in self._distances[comp])
+
+    def bounds(self, w1: str, w2: str) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """
+        Retorna (cota_inferior, cota_superior) de la distancia entre w1 y w2.
+        (None, None) si están en componentes distintas (no hay camino) y
+        None si alguna de las dos no está en una componente indexada.
+        """
+        p1, p2 = self.profile(w1), self.profile(w2)
+        if p1 is None or p2 is None:
+            return None
+        if p1[0] != p2[0]:
+            return None, None
+        lower = max(abs(a - b) for a, b in zip(p1[1], p2[1]))
+        upper = min(a + b for a, b in zip(p1[1], p2[1]))
+        return lower, upper
+
+    def nbytes(self) -> int:
+        """Memoria de los arrays de distancias, en bytes (sin contar el diccionario de índices)."""
+        return (self._component.itemsize * len(self._component)
+                + sum(d.itemsize * len(d) for dists in self._distances for d in dists))
@@ -0,0 +1,31 @@
+import pytest
+import networkx as nx
+from graph.node import Node
+
+class TestLandmarks:
+    def test_bounds_contain_exact_distance(self, ladder_graph):
+        graph = ladder_graph
+        oracle = graph.build_landmarks(k=2, min_component_size=3)
+        assert "bee" not in oracle  # componente pequeña, sin landmarks
+        words = ["cold", "cord", "card", "ward", "warm", "worm", "word"]
+        for w1 in words:
+            for w2 in words:
+                lower, upper = oracle.bounds(w1, w2)
+                exact = nx.shortest_path_length(graph.graph, Node(w1), Node(w2))
+                assert lower <= exact <= upper
+
+    def test_distance(self, ladder_graph):
+        graph = ladder_graph
+        graph.build_landmarks(k=2, min_component_size=3)
+        assert graph.distance("cold", "warm") == 4
+        assert graph.distance("bee", "bed") == 1
+        assert graph.distance_bounds("bee", "bed") == (1, 1)
+
+    def test_no_path_across_components(self, ladder_graph):
+        graph = ladder_graph
+        graph.build_landmarks(k=2, min_component_size=2)
+        assert graph.graph.graph["landmarks"].bounds("cold", "bee") == (None, None)
+        with pytest.raises(nx.NetworkXNoPath):
+            graph.shortest_path("cold", "bee")
+        with pytest.raises(nx.NetworkXNoPath):
+            graph.distance("cold", "bee")
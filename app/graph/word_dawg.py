@@ -0,0 +1,193 @@
+# graph/word_dawg.py
+
+from array import array
+from typing import Iterable, List, Set
+
+
+class _State:
+    __slots__ = ("edges", "final", "id")
+
+    def __init__(self):
+        self.edges = {}
+        self.final = False
+        self.id = None
+
+    def signature(self):
+        return self.final, tuple(sorted((c, child.id) for c, child in self.edges.items()))
+
+
+class WordDawg:
+    """
+    Autómata acíclico mínimo (DAWG) sobre el vocabulario, para búsquedas por
+    prefijo y por patrón con comodines:
+      - '_' equivale a exactamente una letra   (c_t  -> cat, cot, cut...)
+      - '*' equivale a cero o más letras        (str* -> todas las que empiezan por str)
+
+    Se construye con el algoritmo incremental de Daciuk sobre las palabras
+    ordenadas (los sufijos comunes se comparten) y después se aplana en
+    arrays, de modo que ocupa unos pocos bytes por arista y se serializa
+    de forma compacta junto al grafo.
+    """
+
+    WILDCARD_ONE = "_"
+    WILDCARD_ANY = "*"
+
+    def __init__(self, words: Iterable[str]):
+        root = self._build(sorted(set(words)))
+        self._flatten(root)
+
+    def _build(self, words: List[str]) -> _State:
+        root = _State()
+        register = {}
+        unchecked = []  # (padre, letra, hijo) aún sin minimizar
+        previous = ""
+        self.word_count = 0
+
+        def minimize(down_to: int):
+            while len(unchecked) > down_to:
+                parent, letter, child = unchecked.pop()
+                key = child.signature()
+                existing = register.get(key)
+                if existing is not None:
+                    parent.edges[letter] = existing
+                else:
+                    child.id = len(register)
+                    register[key] = child
+
+        for word in words:
+            common = 0
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+                common += 1
+            minimize(common)
+            node = unchecked[-1][2] if unchecked else root
+            for letter in word[common:]:
+                child = _State()
+                node.edges[letter] = child
+                unchecked.append((node, letter, child))
+                node = child
+            node.final = True
+            previous = word
+            self.word_count += 1
+        minimize(0)
+        return root
+
+    def _flatten(self, root: _State):
+        """Numera los estados y guarda las aristas (ordenadas por letra) en arrays."""
+        order = [root]
+        index = {id(root): 0}
+        i = 0
+        while i < len(order):
+            for _, child in sorted(order[i].edges.items()):
+                if id(child) not in index:
+                    index[id(child)] = len(order)
+                    order.append(child)
+            i += 1
+
+        self._final = bytearray(len(order))
+        self._first = array("I", [0])
+        self._labels = array("I")
+        self._targets = array("I")
+        for state_id, state in enumerate(order):
+            self._final[state_id] = state.final
+            for letter, child in sorted(state.edges.items()):
+                self._labels.append(ord(letter))
+                self._targets.append(index[id(child)])
+            self._first.append(len(self._labels))
+
+    def __len__(self):
+        return self.word_count
+
+    def __contains__(self, word: str) -> bool:
+        state = 0
+        for letter in word:
+            state = self._step(state, ord(letter))
+            if state is None:
+                return False
+        return bool(self._final[state])
+
+    @property
+    def state_count(self) -> int:
+        return len(self._final)
+
+    def nbytes(self) -> int:
+        """Memoria ocupada por las estructuras del autómata, en bytes."""
+        return (len(self._final)
+                + sum(a.itemsize * len(a) for a in (self._first, self._labels, self._targets)))
+
+    def _step(self, state: int, code: int):
+        for e in range(self._first[state], self._first[state + 1]):
+            if self._labels[e] == code:
+                return self._targets[e]
+        return None
+
+    def _closure(self, positions: Set[int], pattern: str) -> frozenset:
+        result = set(positions)
+        stack = list(positions)
+        while stack:
+            p = stack.pop()
+            if p < len(pattern) and pattern[p] == self.WILDCARD_ANY and p + 1 not in result:
+                result.add(p + 1)
+                stack.append(p + 1)
+        return frozenset(result)
+
+    def _advance(self, positions: frozenset, pattern: str, letter: str) -> frozenset:
+        following = set()
+        for p in positions:
+            if p == len(pattern):
+                continue
+            token = pattern[p]
+            if token == self.WILDCARD_ANY:
+                following.add(p)
+            elif token == self.WILDCARD_ONE or token == letter:
+                following.add(p + 1)
+        return self._closure(following, pattern) if following else frozenset()
+
+    def match(self, pattern: str, limit: int = 100, max_visits: int = 50000) -> List[str]:
+        """
+        Retorna, en orden alfabético, hasta 'limit' palabras que encajan con el
+        patrón. Recorre el autómata simulando el patrón como un NFA, así que
+        cada palabra aparece una sola vez y las ramas sin coincidencias se podan.
+
+        Los pares (estado, posiciones del patrón) que ya se sabe que no llevan a
+        ninguna coincidencia se memorizan: como el DAWG comparte sufijos, el
+        trabajo queda acotado por estados x conjuntos de posiciones y no por el
+        número de caminos (p. ej. '*zqx' sin resultados no recorre todo el vocabulario).
+        Aun así, si la búsqueda visita más de 'max_visits' estados se aborta con
+        ValueError para que un patrón no acapare la petición.
+        """
+        while self.WILDCARD_ANY * 2 in pattern:
+            pattern = pattern.replace(self.WILDCARD_ANY * 2, self.WILDCARD_ANY)
+        results = []
+        budget = [max_visits]
+        self._collect(0, "", self._closure({0}, pattern), pattern, limit, results, set(), {}, budget)
+        return results
+
+    def _collect(self, state: int, prefix: str, positions: frozenset, pattern: str,
+                 limit: int, results: List[str], dead: set, transitions: dict, budget: list) -> bool:
+        """DFS de match(); retorna si el subárbol de 'state' contiene alguna coincidencia."""
+        budget[0] -= 1
+        if budget[0] < 0:
+            raise ValueError(f"El patrón '{pattern}' es demasiado costoso; acótelo con más letras.")
+        found = False
+        if len(pattern) in positions and self._final[state]:
+            results.append(prefix)
+            found = True
+        for e in range(self._first[state], self._first[state + 1]):
+            if len(results) >= limit:
+                return True
+            letter = chr(self._labels[e])
+            following = transitions.get((positions, letter))
+            if following is None:
+                following = transitions[(positions, letter)] = self._advance(positions, pattern, letter)
+            if not following:
+                continue
+            key = (self._targets[e], following)
+            if key in dead:
+                continue
+            if self._collect(key[0], prefix + letter, following, pattern, limit, results, dead, transitions, budget):
+                found = True
+            else:
+                dead.add(key)
+        return found
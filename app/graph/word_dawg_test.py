@@ -0,0 +1,41 @@
+import pickle
+import random
+import pytest
+from graph.word_dawg import WordDawg
+
+WORDS = ["cat", "cot", "cut", "cart", "card", "string", "strong", "strap", "dog"]
+
+class TestWordDawg:
+    def test_contains(self):
+        dawg = WordDawg(WORDS)
+        assert len(dawg) == len(WORDS)
+        assert "cart" in dawg
+        assert "car" not in dawg
+
+    def test_single_letter_wildcard(self):
+        dawg = WordDawg(WORDS)
+        assert dawg.match("c_t") == ["cat", "cot", "cut"]
+
+    def test_prefix_and_any_wildcard(self):
+        dawg = WordDawg(WORDS)
+        assert dawg.match("str*") == ["strap", "string", "strong"]
+        assert dawg.match("*ng") == ["string", "strong"]
+        assert dawg.match("ca*", limit=2) == ["card", "cart"]
+
+    def test_shares_suffixes_and_pickles(self):
+        # "string"/"strong" comparten el sufijo "ng": el DAWG tiene menos estados que letras
+        dawg = WordDawg(WORDS)
+        assert dawg.state_count < sum(len(w) for w in WORDS)
+        restored = pickle.loads(pickle.dumps(dawg))
+        assert restored.match("c_t") == ["cat", "cot", "cut"]
+
+    def test_leading_wildcard_without_match(self):
+        rng = random.Random(0)
+        vocabulary = {"".join(rng.choice("abcdefghij") for _ in range(rng.randint(3, 8))) for _ in range(5000)}
+        dawg = WordDawg(vocabulary)
+        # Los pares (estado, posiciones) muertos se memorizan: el trabajo está
+        # acotado por el número de estados y no por el de palabras/caminos
+        assert dawg.match("*zqx", max_visits=dawg.state_count + 1) == []
+        assert dawg.match("*j_a", limit=5) == sorted(w for w in vocabulary if w[-3] == "j" and w[-1] == "a")[:5]
+        with pytest.raises(ValueError):
+            dawg.match("*zqx", max_visits=10)
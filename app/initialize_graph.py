@@ -3,8 +3,10 @@
 import os
 import sys
 import pickle
+import argparse
 import logging
 from graph.graph import Graph
+from graph.landmarks import MIN_COMPONENT_SIZE
 
 from config import DATA_MART_PATH
 
@@ -19,8 +21,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def main():
-    graph = Graph()
+def main(allow_indels: bool = False, max_edit_distance: int = 1,
+         landmarks: int = 0, landmark_min_component: int = MIN_COMPONENT_SIZE):
+    graph = Graph(allow_indels=allow_indels)
     try:
         logger.info("Iniciando construcción del grafo")
         all_words = set()
@@ -41,15 +44,22 @@ def main():
         for w in all_words:
             graph.add_node(w)
 
+        # Índice de borrados: sirve para /neighbors y para generar los edges
+        # sin comparar todos los pares de palabras
+        graph.build_edit_index(max_edit_distance)
+        logger.info(f"Índice de borrados construido (distancia máxima {max_edit_distance}).")
+
+        # DAWG del vocabulario para /words
+        dawg = graph.build_word_index()
+        logger.info(f"Índice de palabras construido: {len(dawg)} palabras, {dawg.state_count} estados, {dawg.nbytes() / 1024:.1f} KiB.")
+
         # Añadir edges
-        all_words_list = list(all_words)
-        total_edges = 0
-        for i in range(len(all_words_list)):
-            for j in range(i + 1, len(all_words_list)):
-                w1 = all_words_list[i]
-                w2 = all_words_list[j]
-                if graph.add_edge(w1, w2):
-                    total_edges += 1
+        total_edges = graph.connect_words()
+
+        # Landmarks opcionales para /distance
+        if landmarks > 0:
+            oracle = graph.build_landmarks(landmarks, landmark_min_component)
+            logger.info(f"Landmarks calculados: {len(oracle.landmarks)} landmarks, {oracle.nbytes() / 1024:.1f} KiB de distancias.")
 
         logger.info(f"Grafo construido exitosamente: {len(graph.graph.nodes)} nodos, {len(graph.graph.edges)} aristas.")
 
@@ -59,8 +69,24 @@ def main():
             pickle.dump(graph.graph, f)
         logger.info(f"Grafo serializado en {serialized_path}")
 
+        # El índice de borrados va aparte: la API solo lo carga con el primer /neighbors
+        edit_index_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'edit_index.pkl')
+        graph.save_edit_index(edit_index_path)
+        logger.info(f"Índice de borrados serializado en {edit_index_path}")
+
     except Exception as e:
         logger.error(f"Error al construir y serializar el grafo: {e}", exc_info=True)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Construye y serializa el grafo de palabras.")
+    parser.add_argument("--indels", action="store_true",
+                        help="Enlaza también palabras de longitudes contiguas a distancia de Levenshtein 1.")
+    parser.add_argument("--max-edit-distance", type=int, default=1,
+                        help="Radio máximo que podrá consultarse en /neighbors (el índice crece mucho con cada unidad).")
+    parser.add_argument("--landmarks", type=int, default=0,
+                        help="Landmarks por componente grande para /distance (0 = desactivado).")
+    parser.add_argument("--landmark-min-component", type=int, default=MIN_COMPONENT_SIZE,
+                        help="Tamaño mínimo de componente para calcular landmarks.")
+    args = parser.parse_args()
+    main(allow_indels=args.indels, max_edit_distance=max(1, args.max_edit_distance),
+         landmarks=args.landmarks, landmark_min_component=args.landmark_min_component)
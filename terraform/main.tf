@@ -134,12 +134,13 @@ resource "aws_instance" "graph_ec2" {
     systemctl restart nginx
     echo "Nginx reiniciado"
 
-    # Navegar al directorio de la API Flask
-    cd /home/ec2-user/tscd/app/api
+    # Navegar al directorio de la app (la API se importa como paquete: api.api)
+    cd /home/ec2-user/tscd/app
     echo "Navegación al directorio de la API Flask completada"
 
-    # Iniciar la API con Gunicorn (usando puerto 5001)
-    nohup gunicorn --bind 127.0.0.1:5001 api:app > app.log 2>&1 &
+    # Iniciar la API con Gunicorn (usando puerto 5001). Con --preload el grafo se
+    # carga una vez en el maestro y los workers lo comparten tras el fork
+    nohup gunicorn --preload --bind 127.0.0.1:5001 api.api:app > app.log 2>&1 &
     echo "Gunicorn iniciado en puerto 5001"
   EOF
 